@@ -1,6 +1,82 @@
 import random
+import sys
 import time
 import os
+from collections import namedtuple
+
+from profiler import profile
+
+# Difficulty level -> (min number, max number, max attempts)
+DIFFICULTIES = {
+    1: (1, 50, 10),
+    2: (1, 100, 7),
+    3: (1, 200, 5),
+    4: (1, 500, 4)
+}
+
+# Feedback ladders as (largest distance, label); the first match wins
+HINT_LEVELS = ((10, "very close"), (20, "close"), (50, "far"), (None, "very far"))
+TEMPERATURE_BANDS = (
+    (5, "🔥 Burning hot!"),
+    (15, "♨️  Hot!"),
+    (30, "💨 Warm"),
+    (50, "❄️  Cold"),
+    (None, "🧊 Freezing!")
+)
+QUICK_BANDS = ((5, "🔥 Very close!"), (15, "♨️ Getting warm!"), (None, None))
+PARITY_HINTS = ("💡 Extra Hint: The number is EVEN", "💡 Extra Hint: The number is ODD")
+
+Feedback = namedtuple('Feedback', ['hint_level', 'band', 'hint', 'temperature',
+                                   'quick_direction', 'quick_closeness'])
+
+def ladder_index(ladder, distance):
+    """Find which step of a feedback ladder a distance falls on"""
+    for index, (limit, _) in enumerate(ladder):
+        if limit is None or distance <= limit:
+            return index
+
+class FeedbackEngine:
+    """Precomputed feedback for every possible wrong guess"""
+    
+    # Past this distance every ladder is on its last step, so one table
+    # covers every difficulty
+    SATURATION = 51
+    
+    def __init__(self):
+        self.span = self.SATURATION
+        # Indexed by guess - target + span
+        self.table = [self.build_entry(offset) for offset in range(-self.span, self.span + 1)]
+    
+    @staticmethod
+    def build_entry(offset):
+        """Build the feedback for a guess that is offset away from the target"""
+        distance = abs(offset)
+        hint_level = ladder_index(HINT_LEVELS, distance)
+        band = ladder_index(TEMPERATURE_BANDS, distance)
+        direction = "HIGHER" if offset < 0 else "LOWER"
+        
+        # Interned so every entry and engine shares one copy of each message
+        hint = sys.intern(f"💡 Hint: You're {HINT_LEVELS[hint_level][1]}! Try going {direction}")
+        return Feedback(
+            hint_level,
+            band,
+            hint,
+            TEMPERATURE_BANDS[band][1],
+            "📈 Try higher!" if offset < 0 else "📉 Try lower!",
+            QUICK_BANDS[ladder_index(QUICK_BANDS, distance)][1]
+        )
+    
+    def lookup(self, guess, target):
+        """Return the Feedback for a guess"""
+        offset = guess - target
+        # Larger distances share the saturated end entries
+        if offset > self.span:
+            offset = self.span
+        elif offset < -self.span:
+            offset = -self.span
+        return self.table[offset + self.span]
+
+FEEDBACK = FeedbackEngine()
 
 class NumberGuessingGame:
     def __init__(self):
@@ -22,6 +98,7 @@ class NumberGuessingGame:
         with open("high_score.txt", "w") as file:
             file.write(str(self.high_score))
     
+    @profile
     def clear_screen(self):
         """Clear the terminal screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -46,45 +123,25 @@ class NumberGuessingGame:
             try:
                 choice = int(input("Enter your choice (1-4): "))
                 if 1 <= choice <= 4:
-                    difficulties = {
-                        1: (1, 50, 10),
-                        2: (1, 100, 7),
-                        3: (1, 200, 5),
-                        4: (1, 500, 4)
-                    }
-                    return difficulties[choice]
+                    return DIFFICULTIES[choice]
                 else:
                     print("Please enter a number between 1 and 4")
             except ValueError:
                 print("Please enter a valid number!")
     
-    def get_hint(self, guess, target, attempts_left):
+    @profile
+    def get_hint(self, guess, target, attempts_left, feedback=None):
         """Provide hints based on the guess"""
-        difference = abs(target - guess)
+        if feedback is None:
+            feedback = FEEDBACK.lookup(guess, target)
         
-        if guess < target:
-            direction = "HIGHER"
-        else:
-            direction = "LOWER"
-        
-        if difference > 50:
-            hint_level = "very far"
-        elif difference > 20:
-            hint_level = "far"
-        elif difference > 10:
-            hint_level = "close"
-        else:
-            hint_level = "very close"
-        
-        print(f"💡 Hint: You're {hint_level}! Try going {direction}")
+        print(feedback.hint)
         
         # Special hint when few attempts remain
         if attempts_left <= 2:
-            if target % 2 == 0:
-                print("💡 Extra Hint: The number is EVEN")
-            else:
-                print("💡 Extra Hint: The number is ODD")
+            print(PARITY_HINTS[target % 2])
     
+    @profile
     def calculate_score(self, attempts_used, max_attempts, range_size, difficulty_multiplier):
         """Calculate score based on performance"""
         base_score = 100
@@ -149,20 +206,11 @@ class NumberGuessingGame:
                 # Provide feedback for wrong guess
                 else:
                     print("❌ Wrong guess!")
-                    self.get_hint(guess, target_number, attempts_left)
+                    feedback = FEEDBACK.lookup(guess, target_number)
+                    self.get_hint(guess, target_number, attempts_left, feedback)
                     
                     # Show temperature-based feedback
-                    difference = abs(target_number - guess)
-                    if difference <= 5:
-                        print("🔥 Burning hot!")
-                    elif difference <= 15:
-                        print("♨️  Hot!")
-                    elif difference <= 30:
-                        print("💨 Warm")
-                    elif difference <= 50:
-                        print("❄️  Cold")
-                    else:
-                        print("🧊 Freezing!")
+                    print(feedback.temperature)
                         
             except ValueError:
                 print("❌ Please enter a valid number!")
@@ -284,17 +332,13 @@ def quick_play():
             if guess == number:
                 print(f"\n🎉 Congratulations! You guessed it in {attempts} attempts!")
                 break
-            elif guess < number:
-                print("📈 Try higher!")
-            else:
-                print("📉 Try lower!")
+            
+            feedback = FEEDBACK.lookup(guess, number)
+            print(feedback.quick_direction)
                 
             # Show how close they are
-            difference = abs(number - guess)
-            if difference <= 5:
-                print("🔥 Very close!")
-            elif difference <= 15:
-                print("♨️ Getting warm!")
+            if feedback.quick_closeness:
+                print(feedback.quick_closeness)
                 
         except ValueError:
             print("❌ Please enter a valid number!")
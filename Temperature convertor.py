@@ -1,7 +1,99 @@
+import bisect
+import csv
 import math
+import os
 import sys
 from datetime import datetime
 
+from profiler import profile
+
+class ReferenceIndex:
+    """Named reference temperatures kept sorted by Kelvin for bisect lookups"""
+    
+    # Stands in for the mtime while the source file is missing
+    MISSING = -1
+    
+    def __init__(self, entries=(), path=None):
+        self.path = path
+        self.mtime = None
+        self.build(entries)
+    
+    def build(self, entries):
+        """Sort (name, kelvin) pairs into parallel lists"""
+        pairs = sorted(entries, key=lambda entry: entry[1])
+        self.names = [name for name, _ in pairs]
+        self.kelvins = [kelvin for _, kelvin in pairs]
+    
+    def refresh(self, to_kelvin):
+        """Reload from the source file if it changed since the last load
+        
+        The first load raises on a missing or invalid file. After that, a
+        missing or half-saved file keeps the last good table and warns once.
+        """
+        if self.path is None:
+            return
+        
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError as e:
+            if self.mtime is None:
+                raise
+            mtime, error = self.MISSING, e
+        else:
+            if mtime == self.mtime:
+                return
+            try:
+                entries = self.read_file(self.path, to_kelvin)
+            except (OSError, ValueError, csv.Error) as e:
+                if self.mtime is None:
+                    raise
+                error = e
+            else:
+                self.build(entries)
+                self.mtime = mtime
+                return
+        
+        # Record what was seen so the same bad state isn't retried every query
+        if mtime != self.mtime:
+            print(f"Warning: keeping previous references, could not reload {self.path}: {error}",
+                  file=sys.stderr)
+            self.mtime = mtime
+    
+    @staticmethod
+    def read_file(path, to_kelvin):
+        """Read a CSV file with name, value and unit columns"""
+        entries = []
+        with open(path, newline='', encoding='utf-8') as file:
+            for line_number, row in enumerate(csv.DictReader(file), 2):
+                try:
+                    value = float(row['value'])
+                    if not math.isfinite(value):
+                        # NaN or infinity would break the sort order bisect relies on
+                        raise ValueError(f"value must be finite, got {row['value']!r}")
+                    entries.append((row['name'].strip(), to_kelvin(value, row['unit'].strip())))
+                except (KeyError, TypeError, AttributeError, ValueError) as e:
+                    raise ValueError(f"{path}:{line_number}: invalid reference row ({e})") from e
+        return entries
+    
+    def __len__(self):
+        return len(self.kelvins)
+    
+    def nearest(self, kelvin):
+        """Return the index of the closest reference, or None if empty"""
+        if not self.kelvins:
+            return None
+        
+        i = bisect.bisect_left(self.kelvins, kelvin)
+        if i == len(self.kelvins):
+            return i - 1
+        if i > 0 and kelvin - self.kelvins[i - 1] <= self.kelvins[i] - kelvin:
+            return i - 1
+        return i
+    
+    def between(self, low, high):
+        """Return the index range of references with low <= kelvin <= high"""
+        return range(bisect.bisect_left(self.kelvins, low), bisect.bisect_right(self.kelvins, high))
+
 class TemperatureConverter:
     def __init__(self):
         self.conversion_history = []
@@ -12,6 +104,9 @@ class TemperatureConverter:
             'Human Body Temperature': {'C': 37, 'F': 98.6, 'K': 310.15},
             'Boiling Point of Water': {'C': 100, 'F': 212, 'K': 373.15}
         }
+        self.references = ReferenceIndex(
+            (desc, temps['K']) for desc, temps in self.common_temperatures.items()
+        )
     
     def celsius_to_fahrenheit(self, celsius):
         """Convert Celsius to Fahrenheit"""
@@ -45,6 +140,7 @@ class TemperatureConverter:
         fahrenheit = self.celsius_to_fahrenheit(celsius)
         return round(fahrenheit, 2)
     
+    @profile
     def log_conversion(self, value, from_unit, to_unit, result):
         """Log conversion to history"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -56,6 +152,7 @@ class TemperatureConverter:
         }
         self.conversion_history.append(entry)
     
+    @profile
     def convert_temperature(self, value, from_unit, to_unit):
         """Main conversion function"""
         from_unit = from_unit.upper()
@@ -86,6 +183,64 @@ class TemperatureConverter:
         self.log_conversion(value, from_unit, to_unit, result)
         return result
     
+    def to_kelvin(self, value, unit):
+        """Convert a temperature in any unit to Kelvin without rounding"""
+        # Unlike the converters above this keeps full precision, so close
+        # references in the index don't collapse into ties
+        unit = unit.upper()
+        if unit == 'C':
+            return value + 273.15
+        elif unit == 'F':
+            return (value - 32) * 5/9 + 273.15
+        elif unit == 'K':
+            return value
+        raise ValueError("Invalid temperature unit. Use C, F, or K.")
+    
+    def from_kelvin(self, kelvin, unit):
+        """Convert a Kelvin temperature to any unit for display"""
+        unit = unit.upper()
+        if unit == 'C':
+            value = kelvin - 273.15
+        elif unit == 'F':
+            value = (kelvin - 273.15) * 9/5 + 32
+        elif unit == 'K':
+            value = kelvin
+        else:
+            raise ValueError("Invalid temperature unit. Use C, F, or K.")
+        # Only strips floating-point noise from the round trip (100.01 stays 100.01)
+        return round(value, 10)
+    
+    def load_references(self, path):
+        """Use a CSV file (name,value,unit) as the reference table"""
+        references = ReferenceIndex(path=path)
+        references.refresh(self.to_kelvin)  # Raises before anything is replaced
+        self.references = references
+    
+    def nearest_reference(self, value, unit='C'):
+        """Find the closest named reference as (name, temperature in unit)"""
+        return self.annotate_readings([value], unit)[0][1:]
+    
+    def references_between(self, low, high, unit='C'):
+        """List references between two temperatures as (name, temperature in unit)"""
+        index = self.references
+        index.refresh(self.to_kelvin)
+        matches = index.between(self.to_kelvin(low, unit), self.to_kelvin(high, unit))
+        return [(index.names[i], self.from_kelvin(index.kelvins[i], unit)) for i in matches]
+    
+    def annotate_readings(self, values, unit='C'):
+        """Pair each reading with its nearest reference as (value, name, reference)"""
+        index = self.references
+        index.refresh(self.to_kelvin)  # One reload check per batch
+        
+        annotated = []
+        for value in values:
+            i = index.nearest(self.to_kelvin(value, unit))
+            if i is None:
+                annotated.append((value, None, None))
+            else:
+                annotated.append((value, index.names[i], self.from_kelvin(index.kelvins[i], unit)))
+        return annotated
+    
     def show_conversion_history(self):
         """Display conversion history"""
         if not self.conversion_history:
@@ -233,16 +388,20 @@ def command_line_mode():
         print("Units: C (Celsius), F (Fahrenheit), K (Kelvin)")
         return
     
+    print(convert_args(converter, sys.argv[1:4]))
+
+def convert_args(converter, args):
+    """Convert from command-line style arguments: <value> <from_unit> <to_unit>"""
     try:
-        value = float(sys.argv[1])
-        from_unit = sys.argv[2].upper()
-        to_unit = sys.argv[3].upper()
+        value = float(args[0])
+        from_unit = args[1].upper()
+        to_unit = args[2].upper()
         
         result = converter.convert_temperature(value, from_unit, to_unit)
-        print(f"{value}°{from_unit} = {result}°{to_unit}")
+        return f"{value}°{from_unit} = {result}°{to_unit}"
         
     except Exception as e:
-        print(f"Error: {e}")
+        return f"Error: {e}"
 
 def show_help():
     """Display help information"""
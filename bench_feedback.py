@@ -0,0 +1,92 @@
+import random
+import timeit
+
+from tool_loader import load_tool
+
+game = load_tool("Guessing game.py", "guessing_game")
+
+def legacy_feedback(guess, target):
+    """The per-guess feedback path as play_game computed it before the engine"""
+    difference = abs(target - guess)
+    
+    if guess < target:
+        direction = "HIGHER"
+    else:
+        direction = "LOWER"
+    
+    if difference > 50:
+        hint_level = "very far"
+    elif difference > 20:
+        hint_level = "far"
+    elif difference > 10:
+        hint_level = "close"
+    else:
+        hint_level = "very close"
+    
+    hint = f"💡 Hint: You're {hint_level}! Try going {direction}"
+    
+    difference = abs(target - guess)
+    if difference <= 5:
+        temperature = "🔥 Burning hot!"
+    elif difference <= 15:
+        temperature = "♨️  Hot!"
+    elif difference <= 30:
+        temperature = "💨 Warm"
+    elif difference <= 50:
+        temperature = "❄️  Cold"
+    else:
+        temperature = "🧊 Freezing!"
+    
+    return hint, temperature
+
+def legacy_quick_feedback(guess, number):
+    """The per-guess feedback path as quick_play computed it before the engine"""
+    if guess < number:
+        direction = "📈 Try higher!"
+    else:
+        direction = "📉 Try lower!"
+    
+    difference = abs(number - guess)
+    if difference <= 5:
+        closeness = "🔥 Very close!"
+    elif difference <= 15:
+        closeness = "♨️ Getting warm!"
+    else:
+        closeness = None
+    
+    return direction, closeness
+
+def main():
+    runs = 200000
+    print(f"{'Difficulty':<12} {'legacy ns':>10} {'engine ns':>10} {'speedup':>8}")
+    print("-" * 43)
+    
+    # quick_play does not range-check guesses, so compare well outside 1-100 too
+    for number in range(1, 101):
+        for guess in range(-200, 301):
+            if guess != number:
+                feedback = game.FEEDBACK.lookup(guess, number)
+                assert (feedback.quick_direction, feedback.quick_closeness) == \
+                    legacy_quick_feedback(guess, number)
+    
+    for level, (min_num, max_num, _) in game.DIFFICULTIES.items():
+        # Both paths must agree on every possible wrong guess
+        for target in range(min_num, max_num + 1):
+            for guess in range(min_num, max_num + 1):
+                if guess != target:
+                    feedback = game.FEEDBACK.lookup(guess, target)
+                    assert (feedback.hint, feedback.temperature) == legacy_feedback(guess, target)
+        
+        pairs = [(random.randint(min_num, max_num), random.randint(min_num, max_num))
+                 for _ in range(1000)]
+        legacy = min(timeit.repeat(lambda: [legacy_feedback(g, t) for g, t in pairs],
+                                   number=runs // 1000, repeat=5))
+        lookup = game.FEEDBACK.lookup
+        current = min(timeit.repeat(lambda: [lookup(g, t) for g, t in pairs],
+                                    number=runs // 1000, repeat=5))
+        
+        print(f"{level:<12} {legacy / runs * 1e9:>10.1f} {current / runs * 1e9:>10.1f} "
+              f"{legacy / current:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
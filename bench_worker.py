@@ -0,0 +1,84 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REQUEST = ['temp', '100', 'C', 'F']
+
+def time_per_call(func, runs):
+    """Average wall time of func in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+def start_daemon(path):
+    """Start the worker daemon and wait until its socket accepts connections"""
+    env = dict(os.environ, WORKER_SOCKET=path)
+    daemon = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, "worker_daemon.py")],
+                              env=env, stderr=subprocess.DEVNULL)
+    for _ in range(500):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+            return daemon, env
+        except OSError:
+            time.sleep(0.01)
+    daemon.kill()
+    raise RuntimeError("worker daemon did not start")
+
+def socket_call(path):
+    """One request on a fresh connection, as the client does"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(('\t'.join(REQUEST) + '\n').encode())
+        sock.shutdown(socket.SHUT_WR)
+        while sock.recv(65536):
+            pass
+
+def pipelined_calls(path, count):
+    """Many requests on one connection, read back as a single stream"""
+    payload = (('\t'.join(REQUEST) + '\n') * count).encode()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(payload)
+        sock.shutdown(socket.SHUT_WR)
+        received = 0
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            received += chunk.count(b'\n')
+    assert received == count
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "worker.sock")
+    daemon, env = start_daemon(path)
+    cold_cmd = [sys.executable, os.path.join(BASE_DIR, "Temperature convertor.py")] + REQUEST[1:]
+    client_cmd = [sys.executable, "-S", os.path.join(BASE_DIR, "worker_client.py")] + REQUEST
+    
+    try:
+        results = [
+            ("cold: python 'Temperature convertor.py'",
+             time_per_call(lambda: subprocess.run(cold_cmd, capture_output=True), 20)),
+            ("warm: python -S worker_client.py",
+             time_per_call(lambda: subprocess.run(client_cmd, capture_output=True, env=env), 20)),
+            ("warm: one socket round trip",
+             time_per_call(lambda: socket_call(path), 2000)),
+            ("warm: pipelined batch (per request)",
+             time_per_call(lambda: pipelined_calls(path, 10000), 5) / 10000),
+        ]
+    finally:
+        daemon.terminate()
+        daemon.wait()
+    
+    print(f"{'Path':<42} {'ms/call':>10}")
+    print("-" * 53)
+    for name, ms in results:
+        print(f"{name:<42} {ms:>10.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,23 @@
+from profiler import profile
+
+def calculate(a, b, op):
+    """Apply an operation to two numbers and format the result"""
+    if op == '+':
+        result = a + b
+    elif op == '-':
+        result = a - b
+    elif op == '*':
+        result = a * b
+    elif op == '/':
+        if b == 0:
+            return "Error: Cannot divide by zero!"
+        result = a / b
+    else:
+        return "Error: Invalid operation!"
+        
+    return f"{a} {op} {b} = {result}"
+
+@profile
 def simple_calculator():
     """Simple calculator function"""
     try:
@@ -5,23 +25,21 @@ def simple_calculator():
         b = float(input("Enter second number: "))
         op = input("Enter operation (+, -, *, /): ")
         
-        if op == '+':
-            result = a + b
-        elif op == '-':
-            result = a - b
-        elif op == '*':
-            result = a * b
-        elif op == '/':
-            if b == 0:
-                return "Error: Cannot divide by zero!"
-            result = a / b
-        else:
-            return "Error: Invalid operation!"
-            
-        return f"{a} {op} {b} = {result}"
+        return calculate(a, b, op)
         
     except ValueError:
         return "Error: Please enter valid numbers!"
 
+def calculate_args(args):
+    """Calculate from command-line style arguments: <a> <op> <b>"""
+    if len(args) != 3:
+        return "Usage: <first number> <operation> <second number>"
+    
+    try:
+        return calculate(float(args[0]), float(args[2]), args[1])
+    except ValueError:
+        return "Error: Please enter valid numbers!"
+
 # Usage
-print(simple_calculator())
\ No newline at end of file
+if __name__ == "__main__":
+    print(simple_calculator())
\ No newline at end of file
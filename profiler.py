@@ -0,0 +1,124 @@
+import atexit
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+# Profiling is opt-in: pass --profile on the command line or set PROFILE=1.
+# The flag is removed from sys.argv so the tools parse their arguments as usual.
+ENABLED = '--profile' in sys.argv or os.environ.get('PROFILE', '') not in ('', '0')
+if '--profile' in sys.argv:
+    sys.argv.remove('--profile')
+
+# Output path; a .folded or .collapsed suffix writes flamegraph collapsed stacks
+OUTPUT = os.environ.get('PROFILE_OUTPUT', 'profile.json')
+
+# Percentiles come from a fixed-size random sample so long runs use bounded memory
+RESERVOIR_SIZE = 1024
+
+_timings = {}
+_stack_times = {}
+_lock = threading.Lock()
+# Each thread (e.g. a worker daemon connection) keeps its own call stack
+_local = threading.local()
+
+class Timing:
+    """Running statistics for one function"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = []
+    
+    def add(self, elapsed):
+        """Record one call, keeping a reservoir sample of durations"""
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(elapsed)
+        else:
+            slot = random.randrange(self.calls)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = elapsed
+
+def profile(func):
+    """Record call counts and latencies for func when profiling is enabled"""
+    if not ENABLED:
+        # Disabled: hand back the original function so there is no overhead
+        return func
+    
+    name = func.__qualname__
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append([name, 0.0])
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _, child_time = stack.pop()
+            # Collapsed stacks are keyed by the full call path and use self time
+            path = ';'.join([frame[0] for frame in stack] + [name])
+            if stack:
+                stack[-1][1] += elapsed
+            with _lock:
+                timing = _timings.get(name)
+                if timing is None:
+                    timing = _timings[name] = Timing()
+                timing.add(elapsed)
+                _stack_times[path] = _stack_times.get(path, 0.0) + elapsed - child_time
+    
+    return wrapper
+
+def percentile(sorted_values, fraction):
+    """Return the value at the given fraction of a sorted list"""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+def summary():
+    """Build per-function statistics in milliseconds"""
+    stats = {}
+    with _lock:
+        timings = [(name, timing.calls, timing.total, timing.max, sorted(timing.samples))
+                   for name, timing in _timings.items()]
+    for name, calls, total, longest, samples in timings:
+        stats[name] = {
+            'calls': calls,
+            'total_ms': round(total * 1000, 4),
+            'p50_ms': round(percentile(samples, 0.50) * 1000, 4),
+            'p90_ms': round(percentile(samples, 0.90) * 1000, 4),
+            'p99_ms': round(percentile(samples, 0.99) * 1000, 4),
+            'max_ms': round(longest * 1000, 4)
+        }
+    return stats
+
+def dump(path=None):
+    """Write collected results as JSON or collapsed stacks"""
+    path = path or OUTPUT
+    if not _timings:
+        return
+    
+    if path.endswith(('.folded', '.collapsed')):
+        # One "frame;frame;frame <microseconds>" line per call path
+        with _lock:
+            stack_times = sorted(_stack_times.items())
+        with open(path, 'w') as file:
+            for stack, seconds in stack_times:
+                file.write(f"{stack} {max(1, round(seconds * 1_000_000))}\n")
+    else:
+        with open(path, 'w') as file:
+            json.dump(summary(), file, indent=2)
+    print(f"Profile written to {path}", file=sys.stderr)
+
+if ENABLED:
+    atexit.register(dump)
@@ -0,0 +1,11 @@
+import importlib.util
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_tool(filename, module_name):
+    """Import one of the tool scripts by file name (they contain spaces)"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(BASE_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
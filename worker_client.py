@@ -0,0 +1,102 @@
+import os
+import socket
+import sys
+
+# Keep this module small: it is started once per call by shell pipelines.
+# For the lowest startup cost run it as: python -S worker_client.py ...
+# Shells without Python can talk to the daemon directly, one request per line:
+#   printf 'temp\t100\tC\tF\n' | socat - UNIX-CONNECT:"$WORKER_SOCKET"
+
+def default_socket_path():
+    """Pick a socket location that other local users cannot take over"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "alfido-worker.sock")
+    
+    # Otherwise a private per-user directory; /tmp only as a last resort
+    private_dir = os.path.join(os.path.expanduser("~"), ".cache", "alfido-worker")
+    try:
+        os.makedirs(private_dir, mode=0o700, exist_ok=True)
+        os.chmod(private_dir, 0o700)
+        return os.path.join(private_dir, "worker.sock")
+    except OSError:
+        return f"/tmp/alfido-worker-{os.getuid()}.sock"
+
+SOCKET_PATH = os.environ.get('WORKER_SOCKET') or default_socket_path()
+
+def send_batch(sock, lines):
+    """Stream requests from a background thread while replies are being read"""
+    import threading
+    errors = []
+
+    def writer():
+        try:
+            for line in lines:
+                words = line.split()
+                if words:
+                    sock.sendall(('\t'.join(words) + '\n').encode())
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Always end the request stream so the reply loop sees EOF
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    return thread, errors
+
+def main():
+    """Forward argv to the worker daemon and print the reply"""
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python worker_client.py temp <value> <from_unit> <to_unit>")
+        print("       python worker_client.py calc <a> <op> <b>")
+        print("       python worker_client.py --batch < requests.txt")
+        return 2
+    
+    # Tabs and newlines are the protocol's separators and would split the request
+    if any('\t' in arg or '\n' in arg or '\r' in arg for arg in args):
+        print("Error: arguments must not contain tabs or newlines", file=sys.stderr)
+        return 2
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(SOCKET_PATH)
+    except OSError:
+        print(f"Error: worker daemon is not running on {SOCKET_PATH}", file=sys.stderr)
+        print("Start it with: python worker_daemon.py", file=sys.stderr)
+        return 1
+    
+    writer, errors = None, []
+    try:
+        if args[0] == '--batch':
+            # One request per input line, e.g. "temp 100 C F" or "calc 3 * 4"
+            writer, errors = send_batch(sock, sys.stdin)
+        else:
+            sock.sendall(('\t'.join(args) + '\n').encode())
+            sock.shutdown(socket.SHUT_WR)
+        
+        out = sys.stdout.buffer
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            out.write(chunk)
+        out.flush()
+    except OSError as e:
+        errors.append(e)
+    finally:
+        if writer is not None:
+            writer.join()
+        sock.close()
+    
+    if errors:
+        print(f"Error: request to worker daemon failed: {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import contextlib
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+from tool_loader import load_tool
+from worker_client import SOCKET_PATH
+
+# Preloaded once so each request skips interpreter startup and imports
+temperature = load_tool("Temperature convertor.py", "temperature_convertor")
+calculator = load_tool("calculator.py", "calculator")
+
+def handle_request(converter, args):
+    """Run one request and return its single-line reply"""
+    if not args or not args[0]:
+        return "Error: Empty request. Use temp or calc."
+    
+    tool, args = args[0], args[1:]
+    if tool == 'temp':
+        if len(args) != 3:
+            return "Usage: temp <value> <from_unit> <to_unit>"
+        reply = temperature.convert_args(converter, args)
+        # Each call is independent, like a fresh CLI run, so don't grow history
+        converter.conversion_history.clear()
+        return reply
+    elif tool == 'calc':
+        return calculator.calculate_args(args)
+    else:
+        return f"Error: Unknown tool '{tool}'. Use temp or calc."
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited, tab-separated requests on one connection"""
+    
+    def setup(self):
+        super().setup()
+        self.converter = temperature.TemperatureConverter()
+    
+    def handle(self):
+        # Requests may be pipelined; replies come back in the same order
+        for line in self.rfile:
+            # Raw clients may send bytes that are not UTF-8; keep replies aligned
+            args = line.decode(errors='replace').rstrip('\r\n').split('\t')
+            reply = handle_request(self.converter, args)
+            self.wfile.write(reply.encode() + b'\n')
+
+class WorkerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+def serve(path=SOCKET_PATH):
+    """Listen on the Unix socket until interrupted"""
+    if os.path.exists(path):
+        # Only remove the socket if nothing is listening on it any more
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except ConnectionRefusedError:
+                os.unlink(path)  # Stale socket from a previous run
+            else:
+                print(f"Error: a worker daemon is already listening on {path}", file=sys.stderr)
+                sys.exit(1)
+    
+    # Treat SIGTERM like Ctrl+C so the socket file is removed on shutdown
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    with WorkerServer(path, WorkerHandler) as server:
+        print(f"Worker daemon listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+
+if __name__ == "__main__":
+    serve()